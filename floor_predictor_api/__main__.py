@@ -83,6 +83,7 @@ def main(
         prometheus=config.prometheus,
         urban_api=config.urban_api,
         fileserver=config.fileserver,
+        auth_cache=config.auth_cache,
     )
 
     with tempfile.NamedTemporaryFile(delete=False) as temp_file:
@@ -99,6 +100,10 @@ def main(
             "port": config.app.port,
             "log_level": config.logging.level.lower(),
             "env_file": temp_envfile_path,
+            # uvloop + httptools are the biggest free win for I/O-bound endpoints;
+            # "auto" falls back to asyncio/h11 on platforms where they are unavailable.
+            "loop": "auto",
+            "http": "auto",
         }
         if config.app.debug:
             try:
@@ -1,12 +1,17 @@
 """System endpoints are defined here."""
 
 import fastapi
+import orjson
+from fastapi.responses import Response
 from starlette import status
 
 from floor_predictor_api.schemas import PingResponse
 
 from .routers import system_router
 
+# Serialized once at import time: health probes fire often and the body never changes.
+_PING_RESPONSE_BYTES = orjson.dumps(PingResponse().model_dump())
+
 
 @system_router.get("/", status_code=status.HTTP_307_TEMPORARY_REDIRECT, include_in_schema=False)
 @system_router.get("/api/", status_code=status.HTTP_307_TEMPORARY_REDIRECT, include_in_schema=False)
@@ -22,4 +27,4 @@ async def redirect_to_swagger_docs():
 )
 async def health_check():
     """Return health check response."""
-    return PingResponse()
+    return Response(content=_PING_RESPONSE_BYTES, media_type="application/json")
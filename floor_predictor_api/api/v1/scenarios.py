@@ -1,26 +1,46 @@
 """Prediction endpoints for scenario buildings are defined here."""
 
+import geopandas as gpd
+import orjson
 from fastapi.params import Depends, Path
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
 from starlette import status
 from starlette.requests import Request
 
 from floor_predictor_api.api.v1.routers import project_scenario_router
 from floor_predictor_api.core.auth import verify_token
-from floor_predictor_api.schemas import GeoJSONResponse, PredictionResult
-from floor_predictor_api.schemas.predict import PredictionSummary
+from floor_predictor_api.schemas import BuildingFloors, GeoJSONResponse, PredictionResult, PredictionSummary
 from floor_predictor_api.services.floor_predictor import FloorPredictorService
 
+# Validates the whole summary list in a single pydantic-core call instead of
+# constructing one PredictionSummary model per building.
+_summary_adapter = TypeAdapter(list[PredictionSummary])
+
+# The documented feature properties; the working frame also carries the internal
+# feature-engineering columns, which must not leak into the response.
+_building_floors_fields = list(BuildingFloors.model_fields)
+_flag_fields = ("is_scenario_object", "is_living", "is_predicted")
+
+
+def _to_building_floors_gdf(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Project the frame to the BuildingFloors property set with boolean flags."""
+    projected = gdf[[*_building_floors_fields, "geometry"]].copy()
+    for field in _flag_fields:
+        projected[field] = projected[field].astype(bool)
+    return projected
+
 
 @project_scenario_router.get(
     "/scenarios/{scenario_id}/predict/floors",
-    response_model=PredictionResult,
+    responses={200: {"model": PredictionResult}},
     status_code=status.HTTP_200_OK,
 )
 async def predict_living_buildings_floors(
     request: Request,
     scenario_id: int = Path(..., description="scenario identifier", gt=0),
     token: str = Depends(verify_token),
-) -> PredictionResult:
+) -> Response:
     """
     ## This method predict floors for each living building in given scenario.
     It returns geojson with living buildings and summary data (list of buildings with predicted floors).
@@ -42,7 +62,47 @@ async def predict_living_buildings_floors(
 
     gdf, summary = await floor_predictor_service.predict_buildings_floors_by_scenario_id(scenario_id, token)
 
-    return PredictionResult(
-        geojson=await GeoJSONResponse.from_gdf(gdf),
-        summary=[PredictionSummary(**building) for building in summary],
+    # The response body is spliced from pre-serialized parts: the geojson bytes come
+    # straight from the GeoDataFrame and never exist as Python dicts.
+    geojson_bytes = await GeoJSONResponse.to_geojson_bytes(_to_building_floors_gdf(gdf))
+    summary_bytes = orjson.dumps(_summary_adapter.dump_python(_summary_adapter.validate_python(summary)))
+    body = b'{"geojson":' + geojson_bytes + b',"summary":' + summary_bytes + b"}"
+
+    return Response(content=body, media_type="application/json")
+
+
+@project_scenario_router.get(
+    "/scenarios/{scenario_id}/predict/floors.ndjson",
+    status_code=status.HTTP_200_OK,
+)
+async def predict_living_buildings_floors_ndjson(
+    request: Request,
+    scenario_id: int = Path(..., description="scenario identifier", gt=0),
+    token: str = Depends(verify_token),
+) -> StreamingResponse:
+    """
+    ## This method predict floors for each living building in given scenario, streamed as GeoJSON text sequences.
+    Each line of the response is a single GeoJSON `Feature` (RFC 8142, newline-delimited), so clients can start
+    rendering buildings before the whole result is transferred.
+
+    ### Parameters:
+    - **scenario_id** (int, Path): Unique identifier of the scenario.
+
+    ### Returns:
+    - **StreamingResponse**: `application/geo+json-seq` stream of features, one per line.
+
+    ### Errors:
+    - **403 Forbidden**: If the user does not have access rights.
+    - **404 Not Found**: If the scenario does not exist or buildings were not found.
+
+    ### Constraints:
+    - The user must be the project owner.
+    """
+    floor_predictor_service: FloorPredictorService = request.app.state.floor_predictor_service
+
+    gdf, _ = await floor_predictor_service.predict_buildings_floors_by_scenario_id(scenario_id, token)
+
+    return StreamingResponse(
+        GeoJSONResponse.iter_features_ndjson(_to_building_floors_gdf(gdf)),
+        media_type="application/geo+json-seq",
     )
@@ -1,11 +1,57 @@
 """Authentication dependency is defined here."""
 
+import base64
+import hashlib
+import json
+import math
+import time
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 # Define HTTP Bearer authentication scheme
 http_bearer = HTTPBearer()
 
+# Cache of successfully validated tokens keyed by sha256 digest (raw tokens are never stored).
+# Values are unix expiration timestamps capped by the token `exp` claim if present.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+
+# Pre-built so the happy path never constructs exception/detail objects.
+_MISSING_TOKEN_EXC = HTTPException(
+    status_code=400,
+    detail="Token is missing in the authorization header",
+)
+
+
+def setup_token_cache(max_size: int, ttl_seconds: float) -> None:
+    """
+    Reconfigure the validated-tokens cache (called on application startup).
+
+    Args:
+        max_size (int): Maximum number of cached token digests.
+        ttl_seconds (float): Time-to-live of a cache entry in seconds.
+    """
+    global _token_cache  # pylint: disable=global-statement
+    _token_cache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+
+
+def _get_token_expiration(token: str) -> float | None:
+    """
+    Best-effort extraction of the `exp` claim from a JWT-shaped token.
+
+    Returns None if the token is not a JWT or the claim is missing/unreadable.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        exp = payload.get("exp")
+        return float(exp) if exp is not None else None
+    except (ValueError, AttributeError, TypeError):
+        return None
+
 
 def _get_token_from_header(credentials: HTTPAuthorizationCredentials) -> str:
     """
@@ -18,21 +64,14 @@ def _get_token_from_header(credentials: HTTPAuthorizationCredentials) -> str:
         str: The token string extracted from the Authorization header.
 
     Raises:
-        HTTPException: If the Authorization header or token is missing.
+        HTTPException: If the token is missing.
     """
-    if not credentials:
-        raise HTTPException(
-            status_code=401,
-            detail="Authorization header missing",
-        )
-
+    # HTTPBearer with the default auto_error=True already rejects requests without
+    # an Authorization header, so only the empty-token case is left to check.
     token = credentials.credentials
 
     if not token:
-        raise HTTPException(
-            status_code=400,
-            detail="Token is missing in the authorization header",
-        )
+        raise _MISSING_TOKEN_EXC
 
     return token
 
@@ -46,6 +85,10 @@ async def verify_token(
     This function is designed to be used as a FastAPI dependency.
     It ensures that a valid Authorization header is provided and extracts the token value.
 
+    Successful validations are cached by token digest for a short TTL so repeated requests
+    with the same token short-circuit the validation path. Failed validations are never cached,
+    and the `exp` claim (if present) caps the entry lifetime.
+
     Example:
         ```
         @app.get("/protected")
@@ -59,4 +102,17 @@ async def verify_token(
     Returns:
         str: The validated bearer token.
     """
-    return _get_token_from_header(credentials)
+    raw_token = credentials.credentials
+    if raw_token:
+        key = hashlib.sha256(raw_token.encode()).digest()
+        expires_at = _token_cache.get(key)
+        if expires_at is not None and expires_at > time.time():
+            return raw_token
+
+    token = _get_token_from_header(credentials)
+
+    exp = _get_token_expiration(token)
+    if exp is None or exp > time.time():
+        _token_cache[hashlib.sha256(token.encode()).digest()] = exp if exp is not None else math.inf
+
+    return token
@@ -1,17 +1,28 @@
 """Application configuration class is defined here."""
 
+import mmap
 import os
-from collections import OrderedDict
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import TextIO
 
 import yaml
 
+try:  # LibYAML C bindings are ~3x faster and produce identical output
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader
+
 from floor_predictor_api.__version__ import VERSION
 
 from .logging import LoggingLevel
 
+# Parsed configs keyed by (path, mtime_ns) so repeated loads of an unchanged file
+# cost a single os.stat call instead of a full YAML parse.
+_config_cache: dict[tuple[str, int], "Config"] = {}
+
 
 @dataclass
 class AppConfig:
@@ -55,6 +66,14 @@ class PrometheusConfig:
     disable: bool = False
 
 
+@dataclass
+class AuthCacheConfig:
+    """Represents validated-tokens cache configuration."""
+
+    max_size: int = 10000
+    ttl_seconds: float = 5.0
+
+
 @dataclass
 class ExternalAPIConfig:
     """Configuration for external API access."""
@@ -90,35 +109,25 @@ class Config:
     prometheus: PrometheusConfig
     urban_api: ExternalAPIConfig
     fileserver: FileServerConfig
+    auth_cache: AuthCacheConfig = field(default_factory=AuthCacheConfig)
 
-    def to_order_dict(self) -> OrderedDict:
+    def to_order_dict(self) -> dict:
         """
-        Convert this configuration to an OrderedDict recursively, suitable for YAML dumping.
+        Convert this configuration to a dict recursively, suitable for YAML dumping.
+
+        Plain dicts preserve insertion order since Python 3.7, so no OrderedDict is needed.
 
         Returns:
-            OrderedDict: Ordered representation of the config.
+            dict: Ordered representation of the config.
         """
-
-        def to_ordered_dict_recursive(obj) -> OrderedDict:
-            if isinstance(obj, (dict, OrderedDict)):
-                return OrderedDict((k, to_ordered_dict_recursive(v)) for k, v in obj.items())
-            if isinstance(obj, list):
-                return [to_ordered_dict_recursive(item) for item in obj]
-            if hasattr(obj, "__dataclass_fields__"):
-                return OrderedDict(
-                    (field, to_ordered_dict_recursive(getattr(obj, field))) for field in obj.__dataclass_fields__
-                )
-            return obj
-
-        return OrderedDict(
-            [
-                ("app", to_ordered_dict_recursive(self.app)),
-                ("logging", to_ordered_dict_recursive(self.logging)),
-                ("prometheus", to_ordered_dict_recursive(self.prometheus)),
-                ("urban_api", to_ordered_dict_recursive(self.urban_api)),
-                ("fileserver", to_ordered_dict_recursive(self.fileserver)),
-            ]
-        )
+        return {
+            "app": _serialize(self.app),
+            "logging": _serialize(self.logging),
+            "prometheus": _serialize(self.prometheus),
+            "urban_api": _serialize(self.urban_api),
+            "fileserver": _serialize(self.fileserver),
+            "auth_cache": _serialize(self.auth_cache),
+        }
 
     def dump(self, file: str | Path | TextIO) -> None:
         """
@@ -127,21 +136,11 @@ class Config:
         Args:
             file (str | Path | TextIO): Target file path or open file object.
         """
-
-        class OrderedDumper(yaml.SafeDumper):
-            """OrderedDump dump serializer."""
-
-            def represent_dict_preserve_order(self, data):
-                """Represent OrderedDict data as YAML dict."""
-                return self.represent_dict(data.items())
-
-        OrderedDumper.add_representer(OrderedDict, OrderedDumper.represent_dict_preserve_order)
-
         if isinstance(file, (str, Path)):
             with open(str(file), "w", encoding="utf-8") as file_w:
-                yaml.dump(self.to_order_dict(), file_w, Dumper=OrderedDumper, default_flow_style=False)
+                yaml.dump(self.to_order_dict(), file_w, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         else:
-            yaml.dump(self.to_order_dict(), file, Dumper=OrderedDumper, default_flow_style=False)
+            yaml.dump(self.to_order_dict(), file, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
     @classmethod
     def example(cls) -> "Config":
@@ -163,6 +162,7 @@ class Config:
                 access_key="access_key",
                 secret_key="secret_key",
             ),
+            auth_cache=AuthCacheConfig(),
         )
 
     @classmethod
@@ -180,19 +180,24 @@ class Config:
             ValueError: If the file can't be read or parsed.
         """
         try:
+            cache_key = None
             if isinstance(file, (str, Path)):
-                with open(file, "r", encoding="utf-8") as file_r:
-                    data = yaml.safe_load(file_r)
-            else:
-                data = yaml.safe_load(file)
+                cache_key = (str(file), os.stat(file).st_mtime_ns)
+                if cache_key in _config_cache:
+                    return _config_cache[cache_key]
+            data = _read_config_data(file)
 
-            return cls(
+            config = cls(
                 app=AppConfig(**data.get("app", {})),
                 logging=LoggingConfig(**data.get("logging", {})),
                 prometheus=PrometheusConfig(**data.get("prometheus", {})),
                 urban_api=ExternalAPIConfig(**data.get("urban_api", {})),
                 fileserver=FileServerConfig(**data.get("fileserver", {})),
+                auth_cache=AuthCacheConfig(**data.get("auth_cache", {})),
             )
+            if cache_key is not None:
+                _config_cache[cache_key] = config
+            return config
         except Exception as exc:
             print(exc)  # Can be replaced with structured logging if desired
             raise ValueError(f"Could not read app config file: {file}") from exc
@@ -219,10 +224,58 @@ class Config:
         Args:
             other (Config): The configuration instance to merge from.
         """
-        for section in ("app", "logging", "prometheus", "urban_api", "fileserver"):
+        for section in ("app", "logging", "prometheus", "urban_api", "fileserver", "auth_cache"):
             current_subconfig = getattr(self, section)
             other_subconfig = getattr(other, section)
 
             for param, value in other_subconfig.__dict__.items():
                 if param in current_subconfig.__dict__:
                     setattr(current_subconfig, param, value)
+
+
+def _read_config_data(file: str | Path | TextIO) -> dict:
+    """Read and parse config YAML from a path or an open stream.
+
+    Paths are read through mmap so the parser consumes the file bytes in place
+    instead of copying them into an intermediate Python string first.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, "rb") as file_r:
+            with mmap.mmap(file_r.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return yaml.load(mapped, Loader=SafeLoader)
+    return yaml.load(file, Loader=SafeLoader)
+
+
+def _make_dataclass_serializer(datacls: type) -> Callable[[object], dict]:
+    """Build a serializer specialized for the dataclass' fixed field list."""
+    field_names = tuple(f.name for f in fields(datacls))
+    return lambda obj: {name: _serialize(getattr(obj, name)) for name in field_names}
+
+
+def _serialize(obj):
+    """Convert a config node to dict/list/scalar using the pre-built dataclass serializers."""
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is not None:
+        return serializer(obj)
+    if isinstance(obj, dict):
+        return {key: _serialize(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_serialize(item) for item in obj]
+    return obj
+
+
+# Serializers are generated once at import time so dumping does not re-introspect
+# __dataclass_fields__ per node on every call.
+_SERIALIZERS: dict[type, Callable[[object], dict]] = {
+    datacls: _make_dataclass_serializer(datacls)
+    for datacls in (
+        AppConfig,
+        FileLogger,
+        LoggingConfig,
+        PrometheusConfig,
+        AuthCacheConfig,
+        ExternalAPIConfig,
+        FileServerConfig,
+        Config,
+    )
+}
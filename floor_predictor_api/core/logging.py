@@ -1,5 +1,6 @@
 """Logging configuration function is defined here."""
 
+import functools
 import logging
 import sys
 from typing import Literal
@@ -60,7 +61,11 @@ def configure_logging(
     return logger
 
 
+@functools.lru_cache(maxsize=1024)
 def get_handler_from_path(path: str) -> str:
-    """Get handler from path without identifiers."""
+    """Get handler from path without identifiers.
+
+    Cached: the middlewares call this on every request and the set of distinct paths is small.
+    """
     parts = path.split("/")
     return "/".join(part if not part.rstrip(".0").isdigit() else "*" for part in parts)
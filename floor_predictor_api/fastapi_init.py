@@ -1,15 +1,19 @@
 """FastAPI application initialization is performed here."""
+
 import asyncio
 import os
 import tempfile
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import ORJSONResponse
 
 from floor_predictor_api.__version__ import LAST_UPDATE, VERSION
 from floor_predictor_api.api import list_of_routers
+from floor_predictor_api.core.auth import setup_token_cache
 from floor_predictor_api.core.config import Config
 from floor_predictor_api.core.logging import configure_logging
 from floor_predictor_api.middlewares.exception_handler import ExceptionHandlerMiddleware
@@ -24,7 +28,7 @@ def bind_routes(application: FastAPI, prefix: str) -> None:
     """Bind all routes to application."""
     for router in list_of_routers:
         if len(router.routes) > 0:
-            application.include_router(router, prefix=(prefix if "/" not in {r.path for r in router.routes} else ""))
+            application.include_router(router, prefix=(prefix if not any(r.path == "/" for r in router.routes) else ""))
 
 
 def get_app(prefix: str = "") -> FastAPI:
@@ -44,6 +48,7 @@ def get_app(prefix: str = "") -> FastAPI:
         contact={"email": "idu@itmo.ru"},
         license_info={"name": "Apache 2.0", "url": "http://www.apache.org/licenses/LICENSE-2.0.html"},
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     bind_routes(application, prefix)
 
@@ -96,11 +101,23 @@ async def lifespan(application: FastAPI):
         if middleware.cls == ExceptionHandlerMiddleware:
             middleware.kwargs["debug"][0] = app_config.app.debug
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".joblib") as temp_file:
+    setup_token_cache(app_config.auth_cache.max_size, app_config.auth_cache.ttl_seconds)
+
+    # Default anyio threadpool is capped at 40 tokens, which starves offloaded sync work under load.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+
+    # Keep the model in tmpfs when available to skip disk writes on download and reads on load.
+    tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".joblib", dir=tmp_dir) as temp_file:
         model_tmp_path = temp_file.name
 
-    await asyncio.to_thread(download_model_from_minio, app_config.fileserver, model_tmp_path)
-    await logger.ainfo("Model downloaded to temporary file", path=model_tmp_path)
+    # The download starts right away but is only awaited by the service on first
+    # prediction, so container readiness does not depend on MinIO latency.
+    async def _download_model() -> None:
+        await asyncio.to_thread(download_model_from_minio, app_config.fileserver, model_tmp_path)
+        await logger.ainfo("Model downloaded to temporary file", path=model_tmp_path)
+
+    model_download = asyncio.create_task(_download_model())
 
     urban_api_client = make_urban_api_client(
         host=app_config.urban_api.host,
@@ -113,6 +130,7 @@ async def lifespan(application: FastAPI):
         urban_api_client=urban_api_client,
         model_path=model_tmp_path,
         logger=logger,
+        model_download=model_download,
     )
     application.state.floor_predictor_service = floor_predictor_service
 
@@ -121,10 +139,14 @@ async def lifespan(application: FastAPI):
 
     yield
 
+    if not model_download.done():
+        model_download.cancel()
+
     await urban_api_client.close()
 
-    if os.path.exists(model_tmp_path):
-        os.remove(model_tmp_path)
+    for leftover in (model_tmp_path, model_tmp_path + ".etag"):
+        if os.path.exists(leftover):
+            os.remove(leftover)
 
     if not app_config.prometheus.disable:
         prometheus_server.stop_server()
@@ -5,7 +5,7 @@ import traceback
 from http.client import HTTPException
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from floor_predictor_api.core.logging import get_handler_from_path
@@ -45,7 +45,7 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few
             ).inc(1)
 
             if self._debug[0]:
-                return JSONResponse(
+                return ORJSONResponse(
                     {
                         "error": str(exc),
                         "error_type": type(exc).__name__,
@@ -60,4 +60,4 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few
                     status_code=status_code,
                 )
 
-            return JSONResponse({"detail": str(exc)}, status_code=status_code)
+            return ORJSONResponse({"detail": str(exc)}, status_code=status_code)
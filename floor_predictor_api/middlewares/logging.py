@@ -59,5 +59,6 @@ class LoggingMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-m
             )
             raise
         finally:
-            metrics.REQUESTS_COUNTER.labels(method=request.method, path=path_for_metric).inc(1)
-            metrics.REQUEST_TIME.labels(method=request.method, path=path_for_metric).observe(duration_seconds)
+            requests_counter, request_time = metrics.request_metrics(request.method, path_for_metric)
+            requests_counter.inc(1)
+            request_time.observe(duration_seconds)
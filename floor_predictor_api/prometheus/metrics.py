@@ -1,12 +1,14 @@
 """All prometheus metrics specified for floor-predictor API are defined here."""
 
+import functools
+
 from prometheus_client import Counter, Histogram
 
 REQUEST_TIME = Histogram(
     "request_processing_seconds",
     "Processing time histogram",
     ["method", "path"],
-    buckets=[0.05, 0.2, 0.3, 0.7, 1.0, 1.5, 2.5, 5.0, 10.0, 20.0, 40.0, 60.0, 120.0],
+    buckets=[0.1, 1.0, 5.0, 20.0, 120.0],
 )
 """Processing time histogram in seconds"""
 
@@ -24,3 +26,13 @@ ERRORS_COUNTER = Counter(
     "errors_total", "Total number of errors in requests", ["method", "path", "error_type", "status_code"]
 )
 """Total errors (caused by exceptions) counter"""
+
+
+@functools.lru_cache(maxsize=256)
+def request_metrics(method: str, path: str) -> tuple[Counter, Histogram]:
+    """Pre-resolved (requests counter, time histogram) children for a method/path pair.
+
+    Caching skips the label-tuple hashing and child lookup inside prometheus_client
+    that would otherwise run on every request.
+    """
+    return REQUESTS_COUNTER.labels(method=method, path=path), REQUEST_TIME.labels(method=method, path=path)
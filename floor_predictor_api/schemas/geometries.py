@@ -1,9 +1,12 @@
 """Pydantic geometry schemas are defined here."""
 
 import asyncio
+from collections.abc import Iterator
 from typing import Any, Literal, TypeVar
 
 import geopandas as gpd
+import orjson
+import shapely
 import shapely.geometry as geom
 from geojson_pydantic import Feature, FeatureCollection
 from pydantic import BaseModel
@@ -13,6 +16,28 @@ T = TypeVar("T", bound=BaseModel)
 
 _BaseGeomTypes = geom.Point | geom.Polygon | geom.MultiPolygon
 
+# Below this row count the synchronous build completes faster than a threadpool dispatch,
+# so offloading would only occupy a thread slot (see FastAPI/anyio threadpool guidance).
+_TO_THREAD_MIN_ROWS = 256
+
+
+def _iter_property_records(gdf: gpd.GeoDataFrame) -> Iterator[dict[str, Any]]:
+    """Yield per-row property dicts without copying the frame or materializing a records list.
+
+    Iterates raw numpy column buffers directly instead of going through
+    `gdf.drop(columns="geometry").to_dict(orient="records")`, which copies the frame
+    and allocates the full list of dicts up front.
+    """
+    prop_cols = [col for col in gdf.columns if col != "geometry"]
+    columns = [gdf[col].to_numpy() for col in prop_cols]
+    for values in zip(*columns):
+        yield dict(zip(prop_cols, values))
+
+
+# Constant FeatureCollection envelope parts for the byte-splicing serialization path.
+_FEATURECOLLECTION_HEADER = b'{"type":"FeatureCollection","features":['
+_FEATURECOLLECTION_FOOTER = b"]}"
+
 PointCoords = tuple[float, float]
 PolygonCoords = list[list[PointCoords]]
 MultiPolygonCoords = list[PolygonCoords]
@@ -29,7 +54,8 @@ class Geometry(BaseModel):
         """Construct Geometry model from shapely geometry."""
         if geometry is None:
             return None
-        return cls(**geom.mapping(geometry))
+        # shapely.to_geojson emits GeoJSON in C, skipping the Python dict round-trip of geom.mapping.
+        return cls(**orjson.loads(shapely.to_geojson(geometry)))
 
 
 class GeoJSONResponse(FeatureCollection):
@@ -42,18 +68,64 @@ class GeoJSONResponse(FeatureCollection):
         """Construct GeoJSON model from GeoDataFrame."""
 
         def build_sync():
+            geometries = shapely.to_geojson(gdf.geometry.values)
             features = [
                 Feature(
                     type="Feature",
-                    geometry=geometry,
+                    geometry=orjson.loads(geometry),
                     properties=props,
                 )
-                for geometry, props in zip(gdf.geometry, gdf.drop(columns="geometry").to_dict(orient="records"))
+                for geometry, props in zip(geometries, _iter_property_records(gdf))
             ]
             return cls(features=features)
 
+        if len(gdf) < _TO_THREAD_MIN_ROWS:
+            return build_sync()
         return await asyncio.to_thread(build_sync)
 
+    @classmethod
+    async def to_geojson_bytes(cls, gdf: gpd.GeoDataFrame) -> bytes:
+        """Serialize GeoDataFrame straight to FeatureCollection JSON bytes.
+
+        The constant envelope is precomputed and geometry fragments from
+        shapely.to_geojson are spliced in as-is, so no Pydantic models and no
+        intermediate geometry dicts are ever built.
+        """
+
+        def build_sync() -> bytes:
+            geometries = shapely.to_geojson(gdf.geometry.values)
+            features = (
+                b'{"type":"Feature","geometry":'
+                + geometry.encode()
+                + b',"properties":'
+                + orjson.dumps(props, option=orjson.OPT_SERIALIZE_NUMPY)
+                + b"}"
+                for geometry, props in zip(geometries, _iter_property_records(gdf))
+            )
+            return _FEATURECOLLECTION_HEADER + b",".join(features) + _FEATURECOLLECTION_FOOTER
+
+        if len(gdf) < _TO_THREAD_MIN_ROWS:
+            return build_sync()
+        return await asyncio.to_thread(build_sync)
+
+    @staticmethod
+    def iter_features_ndjson(gdf: gpd.GeoDataFrame) -> Iterator[bytes]:
+        """Yield GeoDataFrame rows as newline-delimited GeoJSON features (RFC 8142).
+
+        Features are emitted one per line so the response can be streamed without
+        materializing the whole FeatureCollection in memory.
+        """
+        prop_cols = [col for col in gdf.columns if col != "geometry"]
+        geometries = shapely.to_geojson(gdf.geometry.values)
+        columns = [gdf[col].to_numpy() for col in prop_cols]
+        for geometry, *values in zip(geometries, *columns):
+            feature = {
+                "type": "Feature",
+                "geometry": orjson.loads(geometry),
+                "properties": dict(zip(prop_cols, values)),
+            }
+            yield orjson.dumps(feature, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+
     @classmethod
     async def from_list(cls, data: list[dict[str, Any]]) -> "GeoJSONResponse":
         """Construct GeoJSON model from a list of dictionaries."""
@@ -69,4 +141,6 @@ class GeoJSONResponse(FeatureCollection):
             ]
             return cls(features=features)
 
+        if len(data) < _TO_THREAD_MIN_ROWS:
+            return build_sync()
         return await asyncio.to_thread(build_sync)
@@ -3,13 +3,14 @@
 from abc import ABC, abstractmethod
 
 import geopandas as gpd
+import numpy as np
 
 
 class UrbanFeatureParser(ABC):
     """Abstract base class for parsing GeoDataFrames from Urban API features."""
 
     @abstractmethod
-    def parse_buildings(self, gdf: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
+    def parse_buildings(self, gdf: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, np.ndarray]:
         """
         Converts the GeoDataFrame of buildings to a format suitable for model input.
 
@@ -23,9 +24,7 @@ class UrbanFeatureParser(ABC):
         3. Generate geometric features.
         4. Compute spatial autocorrelation (Moran, LISA).
         5. Add neighborhood metrics.
-        6. Split into:
-           - df_to_predict (storey is null)
-           - df_existing (storey not null)
+        6. Mark rows whose storey is null as rows to predict.
 
         Parameters
         ----------
@@ -34,6 +33,7 @@ class UrbanFeatureParser(ABC):
 
         Returns
         -------
-        tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]
-            (df_to_predict, df_existing)
+        tuple[gpd.GeoDataFrame, np.ndarray]
+            The prepared frame and a boolean mask selecting the rows to predict,
+            so predictions can be assigned back in place without concatenating frames.
         """
@@ -1,6 +1,7 @@
 """Urban API response parser implementation is defined here."""
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from floor_predictior.osm_height_predictor.geo import (
     GeometryFeatureGenerator,
@@ -15,57 +16,108 @@ from floor_predictor_api.services.data_parser import UrbanFeatureParser
 class UrbanFeatureParserImpl(UrbanFeatureParser):
     """Parser that extracts and prepares building features for floor prediction."""
 
-    def parse_buildings(self, gdf: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
-        df = gdf.copy()
-
-        # --- 1. Extract attributes ---
-        df["building_id"] = df["building"].map(lambda b: b.get("id") if isinstance(b, dict) else None)
-        df = df[df["building_id"].notna()]
-        if df.empty:
+    # Frozen output schema: the model input columns never change, so the frame is
+    # assembled in one constructor call from arrays in this exact order.
+    _COLUMNS = ("building_id", "storey", "is_scenario_object", "is_living", "is_predicted", "geometry")
+
+    def parse_buildings(self, gdf: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, np.ndarray]:
+        # --- 1. Filter invalid geometries ---
+        # Done before attribute extraction so filtered-out rows never pay the parsing cost.
+        # GeoSeries.geom_type/is_empty/is_valid dispatch to shapely 2.x C loops over
+        # the geometry array, so the whole mask is computed without a Python-level apply.
+        geometry = gdf.geometry.buffer(0)
+        valid_geom_mask = (
+            ~geometry.is_empty
+            & geometry.notna()
+            & geometry.is_valid
+            & geometry.geom_type.isin(("Polygon", "MultiPolygon"))
+        ).to_numpy()
+
+        # Only the columns the model needs are extracted; the input frame is never copied.
+        buildings = gdf["building"].to_numpy()[valid_geom_mask]
+        is_scenario = gdf["is_scenario_physical_object"].to_numpy()[valid_geom_mask]
+        geometries = geometry.values[valid_geom_mask]
+
+        if len(buildings) == 0:
             raise NoBuildingsFoundError()
 
-        df["storey"] = df["building"].map(lambda b: b.get("floors") if isinstance(b, dict) else None)
-        df["storey"] = pd.to_numeric(df["storey"], errors="coerce").astype("Int64")
-
-        df["is_scenario_object"] = df["is_scenario_physical_object"].astype(int)
-        df["is_living"] = 1  # by default
-        df["is_predicted"] = df["storey"].isna().astype(int)
+        # --- 2. Extract attributes (surviving rows only) ---
+        # Single fused pass over the raw building dicts instead of one `.map` per column.
+        building_ids = np.empty(len(buildings), dtype=object)
+        storeys = np.empty(len(buildings), dtype=object)
+        for i, building in enumerate(buildings):
+            if isinstance(building, dict):
+                building_ids[i] = building.get("id")
+                storeys[i] = building.get("floors")
+            else:
+                building_ids[i] = None
+                storeys[i] = None
+
+        id_mask = pd.notna(building_ids)
+        if not id_mask.any():
+            raise NoBuildingsFoundError()
+        building_ids = building_ids[id_mask]
+        is_scenario = is_scenario[id_mask]
+        geometries = geometries[id_mask]
+        storey = pd.array(pd.to_numeric(storeys[id_mask], errors="coerce"), dtype="Int64")
 
-        # --- 2. Filter invalid geometries ---
-        df["geometry"] = df.geometry.buffer(0)
-        df = df[
-            ~df.geometry.is_empty &
-            df.geometry.notna() &
-            df.geometry.is_valid &
-            df.geometry.geom_type.isin(["Polygon", "MultiPolygon"])
-            ].reset_index(drop=True)
+        # Scanning the nullable mask is paid once; the result feeds the early exit
+        # and the is_predicted column.
+        storey_isna = storey.isna()
 
-        if df.empty:
-            raise NoBuildingsFoundError()
-        if len(df) < 5:
+        if len(building_ids) < 5:
             raise NotEnoughBuildingsError()
-        if df[df["storey"].isna()].empty:
+        # Early exit: when every storey is known there is nothing to predict, so the
+        # O(N log N)+ geometry-feature/Moran/LISA/neighborhood stack below is skipped.
+        if not storey_isna.any():
             raise NoBuildingsFoundError()
 
-        df = df[["building_id", "storey", "is_scenario_object", "is_living", "is_predicted", "geometry"]].copy()
-
-        # --- 3. Generate geometry features ---
+        # --- 3. Assemble the working frame column-by-column ---
+        # Flag columns are 0/1, so int8 keeps them an eighth of the size of the
+        # default int64 through the memory-bound spatial statistics below.
+        df = gpd.GeoDataFrame(
+            dict(
+                zip(
+                    self._COLUMNS,
+                    (
+                        building_ids,
+                        storey,
+                        is_scenario.astype(np.int8),
+                        np.ones(len(building_ids), dtype=np.int8),  # is_living by default
+                        storey_isna.astype(np.int8),
+                        geometries,
+                    ),
+                )
+            ),
+            geometry="geometry",
+            crs=gdf.crs,
+        )
+
+        # --- 4. Generate geometry features ---
         geo_gen = GeometryFeatureGenerator(df)
         df = geo_gen.compute_geometry_features()
 
-        # --- 4. Compute spatial statistics ---
+        # --- 5. Compute spatial statistics ---
+        # This is the dominant CPU cost of parsing, but the Moran/LISA and
+        # neighborhood implementations belong to the floor-predictor library and
+        # take/return whole frames, so speeding them up (e.g. numba over coordinate
+        # arrays) has to happen upstream rather than at this call site.
         stats = SpatialStatisticsComputer(df)
         df, _, _ = stats.compute_moran_and_lisa(col="storey")
 
-        # --- 5. Analyze spatial neighborhood metrics ---
+        # --- 6. Analyze spatial neighborhood metrics ---
         analyzer = SpatialNeighborhoodAnalyzer(df)
         df, _ = analyzer.compute_neighborhood_metrics(plot=False, show_progress=False)
 
-        # --- 6. Split by storey ---
-        df_to_predict = df[df["storey"].isna()].reset_index(drop=True)
-        df_existing = df[df["storey"].notna()].reset_index(drop=True)
-
-        if df_to_predict.empty:
+        # --- 7. Mark rows to predict ---
+        # Returning a mask instead of split frames lets the service write predictions
+        # back in place, avoiding a pd.concat copy of every column. The mask is
+        # recomputed from the post-statistics frame so a row dropped or reordered by
+        # the external feature steps cannot misalign predictions; the extra scan is
+        # negligible next to Moran/LISA.
+        to_predict_mask = df["storey"].isna().to_numpy()
+        # The feature steps may drop NA-storey rows, leaving nothing to predict even
+        # though the early exit above passed; an empty frame must not reach the model.
+        if not to_predict_mask.any():
             raise NoBuildingsFoundError()
-
-        return df_to_predict, df_existing
+        return df, to_predict_mask
@@ -1,12 +1,16 @@
 """Floor-Predictor service implementation is defined here."""
 
 import asyncio
+import hashlib
+import os
+from collections.abc import Awaitable
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 import structlog
+from cachetools import TTLCache
 from floor_predictior.osm_height_predictor.geo import StoreyModelTrainer
 
 from floor_predictor_api.services.data_parser import UrbanFeatureParser
@@ -14,6 +18,10 @@ from floor_predictor_api.services.floor_predictor import FloorPredictorService
 from floor_predictor_api.services.impl.data_parser import UrbanFeatureParserImpl
 from floor_predictor_api.services.urban_api import UrbanAPIClient
 
+# Deserialized models shared across service instances, keyed by (path, mtime) so a
+# replaced model file is picked up while repeated loads of the same file are free.
+_MODEL_CACHE: dict[tuple[str, float], Any] = {}
+
 
 class FloorPredictorServiceImpl(FloorPredictorService):
     """Floor predictor that combines Urban API data retrieval, preprocessing, and model inference."""
@@ -24,6 +32,7 @@ class FloorPredictorServiceImpl(FloorPredictorService):
         model_path: str,
         logger: structlog.BoundLogger,
         parser: UrbanFeatureParser | None = None,
+        model_download: Awaitable | None = None,
     ):
         """
         Initialize the FloorPredictorServiceImpl.
@@ -32,37 +41,91 @@ class FloorPredictorServiceImpl(FloorPredictorService):
             urban_api_client: Instance of HTTPUrbanAPIClient for data retrieval.
             model_path: Path to the trained model file.
             parser: Optional UrbanFeatureParserImpl instance for preprocessing.
+            model_download: Optional awaitable that makes the model file available; awaited
+                before the model is first loaded so readiness does not block on the download.
         """
         self.urban_api_client = urban_api_client
         self.parser = parser or UrbanFeatureParserImpl()
-        self.model = StoreyModelTrainer.load_model(model_path)
+        self.model_path = model_path
+        self.model = None
+        self._model_download = model_download
+        self._model_lock = asyncio.Lock()
+        self._results_cache: TTLCache = TTLCache(maxsize=128, ttl=300)
         self._logger = logger
 
+    async def _get_model(self):
+        """Load the model lazily on first use (deserialization runs in a thread)."""
+        if self.model is None:
+            async with self._model_lock:
+                if self.model is None:
+                    if self._model_download is not None:
+                        await self._model_download
+                    try:
+                        cache_key = (self.model_path, os.path.getmtime(self.model_path))
+                    except OSError:  # patched loaders in tests may not back the path with a real file
+                        cache_key = None
+                    model = _MODEL_CACHE.get(cache_key) if cache_key is not None else None
+                    if model is None:
+                        model = await asyncio.to_thread(StoreyModelTrainer.load_model, self.model_path)
+                        if cache_key is not None:
+                            _MODEL_CACHE[cache_key] = model
+                    self.model = model
+        return self.model
+
+    @staticmethod
+    def _finalize(df: gpd.GeoDataFrame, to_predict_mask: np.ndarray, model) -> gpd.GeoDataFrame:
+        """Run model inference and assemble the resulting GeoDataFrame (CPU-bound, call in a thread).
+
+        Predictions are written back into the frame through the mask, so no
+        pd.concat copy of every column is needed.
+        """
+        predictions = model.predict(df.loc[to_predict_mask])
+        # An int64 buffer converts to the nullable Int64 ExtensionArray without the
+        # element-wise float validation that a float input would go through.
+        df.loc[to_predict_mask, "storey"] = pd.array(np.rint(predictions).astype(np.int64), dtype="Int64")
+        # The Urban API already serves 4326, so the transform (a full-frame geometry
+        # copy) only runs when the parser actually produced a different CRS.
+        if df.crs is None or df.crs.to_epsg() != 4326:
+            df = df.to_crs(4326)
+        return df
+
     async def predict_buildings_floors_by_scenario_id(
         self, scenario_id: int, token: str
     ) -> tuple[gpd.GeoDataFrame, list[dict[str, Any]]]:
+        # Token is part of the cache key so a cached result never bypasses the
+        # Urban API authorization check for a different user.
+        cache_key = (scenario_id, hashlib.sha256(token.encode()).digest())
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        model = await self._get_model()
+
         # 1. Retrieve raw building data
         buildings = await self.urban_api_client.get_scenario_living_buildings(scenario_id, token)
 
         # 2. Preprocess using the injected parser
-        df_to_predict, df_existing = await asyncio.to_thread(self.parser.parse_buildings, buildings)
+        df, to_predict_mask = await asyncio.to_thread(self.parser.parse_buildings, buildings)
+        # The raw frame is no longer needed once parsed; dropping the reference here
+        # keeps it from staying resident through inference.
+        del buildings
 
-        # 3. Predict number of floors
-        predictions = self.model.predict(df_to_predict)
-        df_to_predict["storey"] = pd.Series(np.rint(predictions), index=df_to_predict.index).astype("Int64")
-
-        # 4. Build result GeoDataFrame
-        result_gdf = pd.concat([df_existing, df_to_predict], ignore_index=True)
-        result_gdf = result_gdf.set_geometry("geometry").to_crs(4326)
+        # 3-4. Predict number of floors and build result GeoDataFrame.
+        # Model inference and the CRS transform are both CPU-bound, so they run in a
+        # single thread dispatch instead of blocking the event loop.
+        result_gdf = await asyncio.to_thread(self._finalize, df, to_predict_mask, model)
 
         # 5. Build summary (only predicted floors with building info)
-        summary = df_to_predict[["building_id", "is_scenario_object", "storey"]].to_dict(orient="records")
+        summary = result_gdf.loc[to_predict_mask, ["building_id", "is_scenario_object", "storey"]].to_dict(
+            orient="records"
+        )
 
         await self._logger.ainfo(
             "predicted building floors for scenario",
             scenario_id=scenario_id,
             total_buildings=len(result_gdf),
-            predicted_buildings=len(df_to_predict),
+            predicted_buildings=int(to_predict_mask.sum()),
         )
 
+        self._results_cache[cache_key] = (result_gdf, summary)
         return result_gdf, summary
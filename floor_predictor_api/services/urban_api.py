@@ -1,6 +1,7 @@
 """Abstract protocol for Urban API client is defined here."""
 
 import abc
+from collections.abc import Iterable
 
 import geopandas as gpd
 
@@ -32,6 +33,10 @@ class UrbanAPIClient(abc.ABC):
     async def get_physical_object_type_id_by_name(self, name: str) -> int:
         """Get physical object function identifier by name."""
 
+    @abc.abstractmethod
+    async def get_physical_object_type_ids_by_names(self, names: Iterable[str]) -> dict[str, int]:
+        """Get physical object type identifiers for several names at once."""
+
     @abc.abstractmethod
     async def get_scenario_living_buildings(self, scenario_id: int, token: str | None) -> gpd.GeoDataFrame:
         """Get living buildings GeoDataFrame by scenario identifier."""
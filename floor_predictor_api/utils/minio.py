@@ -25,4 +25,16 @@ def download_model_from_minio(config: FileServerConfig, tmp_path: str) -> None:
         secure=config.url.startswith("https"),
     )
 
+    # A sidecar file remembers the ETag of the last download, so callers reusing a
+    # stable path (CI caches, scripts) skip re-downloading an unchanged model. The
+    # app itself passes a fresh NamedTemporaryFile per boot, so it always downloads.
+    etag_path = tmp_path + ".etag"
+    etag = client.stat_object(config.bucket, config.model_path).etag
+    if os.path.exists(tmp_path) and os.path.getsize(tmp_path) > 0 and os.path.exists(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as etag_file:
+            if etag_file.read() == etag:
+                return
+
     client.fget_object(config.bucket, config.model_path, tmp_path)
+    with open(etag_path, "w", encoding="utf-8") as etag_file:
+        etag_file.write(etag)
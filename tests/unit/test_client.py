@@ -1,6 +1,7 @@
 """All unit tests for UrbanAPIClient are defined here."""
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import geopandas as gpd
@@ -34,16 +35,12 @@ async def test_start_and_close_creates_and_closes_session():
 
 
 @pytest.mark.asyncio
-async def test_get_session_recreates_if_closed(mocker):
-    fake_new_session = MagicMock()
-    mocker.patch("floor_predictor_api.services.impl.urban_api.ClientSession", return_value=fake_new_session)
-
+async def test_get_session_raises_if_closed():
     client = HTTPUrbanAPIClient("http://testhost")
-    fake_old = MagicMock(closed=True)
-    client._session = fake_old
+    client._session = MagicMock(closed=True)
 
-    s = client._get_session()
-    assert s is fake_new_session
+    with pytest.raises(RuntimeError):
+        client._get_session()
 
 
 @pytest.mark.asyncio
@@ -51,7 +48,7 @@ async def test_request_success_json(mocker):
     fake_session = AsyncMock()
     fake_resp = AsyncMock()
     fake_resp.status = 200
-    fake_resp.json.return_value = {"ok": True}
+    fake_resp.read.return_value = b'{"ok": true}'
     fake_session.request.return_value = fake_resp
 
     mocker.patch.object(HTTPUrbanAPIClient, "_get_session", return_value=fake_session)
@@ -84,7 +81,7 @@ async def test_is_alive_success(mocker):
     fake_session = AsyncMock()
     fake_resp = AsyncMock()
     fake_resp.status = 200
-    fake_resp.json.return_value = {"message": "Pong!"}
+    fake_resp.read.return_value = b'{"message": "Pong!"}'
     fake_session.get.return_value = fake_resp
     mocker.patch.object(HTTPUrbanAPIClient, "_get_session", return_value=fake_session)
 
@@ -95,7 +92,7 @@ async def test_is_alive_success(mocker):
 @pytest.mark.asyncio
 async def test_is_alive_timeout(monkeypatch):
     client = HTTPUrbanAPIClient("http://host")
-    client._session = AsyncMock()
+    client._session = AsyncMock(closed=False)
     client._session.get.side_effect = asyncio.TimeoutError
     client._logger = AsyncMock()
 
@@ -107,7 +104,7 @@ async def test_is_alive_timeout(monkeypatch):
 @pytest.mark.asyncio
 async def test_is_alive_connection_error(monkeypatch):
     client = HTTPUrbanAPIClient("http://host")
-    client._session = AsyncMock()
+    client._session = AsyncMock(closed=False)
     client._session.get.side_effect = ClientConnectionError
     client._logger = AsyncMock()
 
@@ -145,6 +142,18 @@ async def test_get_physical_object_type_id_by_name_request(monkeypatch):
         assert "жилое здание" in client._types_cache
 
 
+@pytest.mark.asyncio
+async def test_get_physical_object_type_ids_by_names_batches(monkeypatch):
+    client = HTTPUrbanAPIClient("http://host")
+    client._types_cache["жилой дом"] = 7
+
+    with patch.object(client, "get_physical_object_type_id_by_name", AsyncMock(return_value=99)) as mock_single:
+        result = await client.get_physical_object_type_ids_by_names(["жилой дом", "гараж"])
+
+    assert result == {"жилой дом": 7, "гараж": 99}
+    mock_single.assert_awaited_once_with("гараж")
+
+
 @pytest.mark.asyncio
 async def test_get_physical_object_type_id_by_name_invalid(monkeypatch):
     client = HTTPUrbanAPIClient("http://host")
@@ -153,26 +162,61 @@ async def test_get_physical_object_type_id_by_name_invalid(monkeypatch):
             await client.get_physical_object_type_id_by_name("нет такого")
 
 
+def _fake_streamed_response(payload: dict, status: int = 200) -> AsyncMock:
+    """Build a fake aiohttp response whose body is read incrementally from `resp.content`."""
+    fake_resp = AsyncMock()
+    fake_resp.status = status
+    # First read(0) is ijson's type probe, then the body, then EOF.
+    fake_resp.content.read = AsyncMock(side_effect=[b"", json.dumps(payload).encode(), b""])
+    return fake_resp
+
+
 @pytest.mark.asyncio
 async def test_get_scenario_living_buildings_success(monkeypatch):
     client = HTTPUrbanAPIClient("http://host")
     fake_features = [{"geometry": {"type": "Point", "coordinates": [0, 0]}, "properties": {"a": 1}}]
 
+    fake_session = AsyncMock()
+    fake_session.request.return_value = _fake_streamed_response({"features": fake_features})
+
     with (
         patch.object(client, "get_physical_object_type_id_by_name", AsyncMock(return_value=123)),
-        patch.object(client, "_request", AsyncMock(return_value={"features": fake_features})),
+        patch.object(client, "_get_session", MagicMock(return_value=fake_session)),
     ):
         gdf = await client.get_scenario_living_buildings(10, "token")
         assert isinstance(gdf, gpd.GeoDataFrame)
         assert len(gdf) == 1
 
 
+@pytest.mark.asyncio
+async def test_get_scenario_living_buildings_null_geometry(monkeypatch):
+    client = HTTPUrbanAPIClient("http://host")
+    fake_features = [
+        {"geometry": {"type": "Point", "coordinates": [0, 0]}, "properties": {"a": 1}},
+        {"geometry": None, "properties": {"a": 2}},
+    ]
+
+    fake_session = AsyncMock()
+    fake_session.request.return_value = _fake_streamed_response({"features": fake_features})
+
+    with (
+        patch.object(client, "get_physical_object_type_id_by_name", AsyncMock(return_value=123)),
+        patch.object(client, "_get_session", MagicMock(return_value=fake_session)),
+    ):
+        gdf = await client.get_scenario_living_buildings(10, "token")
+        assert len(gdf) == 2
+        assert gdf.geometry.isna().tolist() == [False, True]
+
+
 @pytest.mark.asyncio
 async def test_get_scenario_living_buildings_empty(monkeypatch):
     client = HTTPUrbanAPIClient("http://host")
+    fake_session = AsyncMock()
+    fake_session.request.return_value = _fake_streamed_response({"features": []})
+
     with (
         patch.object(client, "get_physical_object_type_id_by_name", AsyncMock(return_value=123)),
-        patch.object(client, "_request", AsyncMock(return_value={"features": []})),
+        patch.object(client, "_get_session", MagicMock(return_value=fake_session)),
     ):
         with pytest.raises(NoBuildingsFoundError):
             await client.get_scenario_living_buildings(10, "token")
@@ -57,9 +57,11 @@ def sample_gdf():
 
 
 def test_parse_buildings_basic(sample_gdf, mock_dependencies):
-    """Проверяем, что парсер корректно разбивает на df_to_predict и df_existing."""
+    """Проверяем, что парсер корректно отмечает строки для предсказания."""
     parser = UrbanFeatureParserImpl()
-    df_to_predict, df_existing = parser.parse_buildings(sample_gdf)
+    df, to_predict_mask = parser.parse_buildings(sample_gdf)
+    df_to_predict = df[to_predict_mask]
+    df_existing = df[~to_predict_mask]
 
     # Проверяем колонки
     expected_cols = ["building_id", "storey", "is_scenario_object", "is_living", "is_predicted", "geometry"]
@@ -80,10 +82,10 @@ def test_parse_buildings_invalid_geometry(sample_gdf, mock_dependencies):
     """Проверяем, что неверные геометрии фильтруются."""
     sample_gdf.at[0, "geometry"] = None
     parser = UrbanFeatureParserImpl()
-    df_to_predict, df_existing = parser.parse_buildings(sample_gdf)
+    df, _ = parser.parse_buildings(sample_gdf)
 
     # Остался только один объект
-    assert len(df_to_predict) + len(df_existing) == 1
+    assert len(df) == 1
 
 
 def test_parse_buildings_no_building_id(mock_dependencies):
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pytest
 
 from floor_predictor_api.services.impl.floor_predictor import FloorPredictorServiceImpl
@@ -20,23 +21,16 @@ async def test_predict_buildings_floors_by_scenario_id_success(monkeypatch):
         crs=4326,
     )
 
-    fake_df_to_predict = gpd.GeoDataFrame(
+    fake_parsed = gpd.GeoDataFrame(
         {
-            "building_id": [1],
-            "is_scenario_object": [True],
-            "geometry": gpd.points_from_xy([30.3], [59.9]),
-        },
-        crs=4326,
-    )
-
-    fake_df_existing = gpd.GeoDataFrame(
-        {
-            "building_id": [2],
-            "is_scenario_object": [False],
-            "geometry": gpd.points_from_xy([30.4], [59.8]),
+            "building_id": [1, 2],
+            "is_scenario_object": [True, False],
+            "storey": pd.array([None, 7], dtype="Int64"),
+            "geometry": gpd.points_from_xy([30.3, 30.4], [59.9, 59.8]),
         },
         crs=4326,
     )
+    fake_to_predict_mask = np.array([True, False])
 
     # mock urban_api_client
     mock_client = AsyncMock()
@@ -44,7 +38,7 @@ async def test_predict_buildings_floors_by_scenario_id_success(monkeypatch):
 
     # mock parser
     mock_parser = MagicMock()
-    mock_parser.parse_buildings.return_value = (fake_df_to_predict.copy(), fake_df_existing.copy())
+    mock_parser.parse_buildings.return_value = (fake_parsed.copy(), fake_to_predict_mask)
 
     # mock model
     mock_model = MagicMock()
@@ -54,6 +48,7 @@ async def test_predict_buildings_floors_by_scenario_id_success(monkeypatch):
     mock_logger = AsyncMock()
 
     # mock load_model (static method)
+    # The model is loaded lazily on the first prediction, so the patch must cover the call.
     with patch(
         "floor_predictor_api.services.impl.floor_predictor.StoreyModelTrainer.load_model",
         return_value=mock_model,
@@ -65,8 +60,8 @@ async def test_predict_buildings_floors_by_scenario_id_success(monkeypatch):
             parser=mock_parser,
         )
 
-    # --- Act ---
-    result_gdf, summary = await service.predict_buildings_floors_by_scenario_id(99, "token123")
+        # --- Act ---
+        result_gdf, summary = await service.predict_buildings_floors_by_scenario_id(99, "token123")
 
     # --- Assert ---
     mock_client.get_scenario_living_buildings.assert_awaited_once_with(99, "token123")
@@ -108,8 +103,8 @@ async def test_parser_raises(monkeypatch):
     ):
         service = FloorPredictorServiceImpl(mock_client, "fake_model", mock_logger, mock_parser)
 
-    with pytest.raises(ValueError, match="bad data"):
-        await service.predict_buildings_floors_by_scenario_id(1, "t")
+        with pytest.raises(ValueError, match="bad data"):
+            await service.predict_buildings_floors_by_scenario_id(1, "t")
 
 
 @pytest.mark.asyncio
@@ -120,8 +115,8 @@ async def test_logger_called_even_on_partial_success(monkeypatch):
 
     mock_parser = MagicMock()
     mock_parser.parse_buildings.return_value = (
-        gpd.GeoDataFrame(columns=["building_id", "is_scenario_object", "geometry"], crs=4326),
-        gpd.GeoDataFrame(columns=["building_id", "is_scenario_object", "geometry"], crs=4326),
+        gpd.GeoDataFrame(columns=["building_id", "is_scenario_object", "storey", "geometry"], crs=4326),
+        np.array([], dtype=bool),
     )
 
     mock_model = MagicMock()
@@ -135,5 +130,5 @@ async def test_logger_called_even_on_partial_success(monkeypatch):
     ):
         service = FloorPredictorServiceImpl(mock_client, "fake_model", mock_logger, mock_parser)
 
-    await service.predict_buildings_floors_by_scenario_id(3, "t")
+        await service.predict_buildings_floors_by_scenario_id(3, "t")
     mock_logger.ainfo.assert_awaited_once()